@@ -0,0 +1,61 @@
+import streamlit as st
+import pandas as pd
+
+# ---------------------------------
+# Feature Descriptions
+# ---------------------------------
+@st.cache_data
+def feature_table():
+    feature_info = {
+        "sleep_hours": 
+        "Average number of hours the student sleeps per day. Adequate sleep improves focus, memory, and academic performance.",
+
+        "exercise_frequency": 
+        "Number of times the student exercises per week. Regular exercise is linked to better mental health and concentration.",
+
+        "stress_level": 
+        "Measures the student's stress level on a scale from 1 to 10. Higher stress often negatively impacts academic outcomes.",
+
+        "screen_time": 
+        "Total daily screen time in hours. Excessive screen usage may reduce study time and sleep quality.",
+
+        "study_environment": 
+        "The environment where the student usually studies (e.g., quiet room, library). A better environment enhances productivity.",
+
+        "access_to_tutoring": 
+        "Indicates whether the student has access to additional tutoring or academic support.",
+
+        "motivation_level": 
+        "Represents how motivated the student is to study, rated from 1 to 10. Higher motivation usually leads to better performance.",
+
+        "exam_anxiety_score": 
+        "Measures anxiety level before exams. High anxiety can reduce exam performance despite good preparation.",
+
+        "study_efficiency": 
+        "Represents how effectively the student studies within a given time. Higher values indicate better focus and learning quality.",
+
+        "screen_time_penalty": 
+        "Quantifies the negative impact of excessive screen time on academic performance."
+    }
+
+    return pd.DataFrame(
+        feature_info.items(),
+        columns=["Feature Name", "Description"]
+    )
+
+
+@st.cache_data
+def feature_html():
+    return feature_table().to_html(index=False)
+
+
+st.title("📘 Feature Description & Input Guide")
+
+st.markdown(
+    """
+    This page explains each feature used in the model and how it impacts
+    the student's academic performance prediction.
+    """
+)
+
+st.markdown(feature_html(), unsafe_allow_html=True)
@@ -0,0 +1,64 @@
+import streamlit as st
+
+# ---------------------------------
+# Load Images
+# ---------------------------------
+@st.cache_data
+def get_hero_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+st.title("🎓 Student Performance Classification")
+
+st.image(get_hero_bytes("dom-fou-YRMWVcdyhmI-unsplash.jpg"), use_container_width=True)
+
+st.markdown("## 📊 Dataset Overview")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.metric("Number of Rows", "≈ 82,000")
+with col2:
+    
+    st.metric("Number of Features", "31")
+st.markdown("""
+### 🔍 What is this dataset about?
+This dataset is designed to analyze and predict students' academic performance by 
+capturing a wide range of behavioral, psychological, and lifestyle factors.
+
+It includes information related to:
+- **Student behavior** (study habits, time management, screen usage)
+- **Mental health** (stress level, exam anxiety, psychological well-being)
+- **Family support** (parental support and family background)
+- **Lifestyle patterns** (sleep quality, diet, and daily routines)
+
+---
+
+### 🎯 Project Objective
+The main goal of this project is to **predict the student's final exam score (Exam Score)**  
+based on these combined factors, helping to understand what truly drives academic success.
+
+---
+
+### 🛠 What did we do?
+- Data Cleaning and Validation  
+- Feature Engineering (e.g., study efficiency, sleep quality, screen time impact)  
+- Encoding Categorical Features  
+- Scaling Numerical Features  
+- Training and Comparing Multiple Regression Models  
+- Hyperparameter Tuning using **Randomized Search**  
+- Selecting the Best-Performing Model  
+
+---
+
+### 💡 Why is this useful?
+- **Early identification** of students at risk of low academic performance  
+- Helping **schools and educators** make data-driven interventions  
+- Supporting **parents** in understanding factors affecting their children’s performance  
+- Guiding **students** toward improving specific behaviors to enhance outcomes  
+- Enabling **data-driven academic decision-making** instead of intuition-based judgment  
+
+This project demonstrates how data can be transformed into actionable insights  
+to improve educational outcomes.
+""")
@@ -0,0 +1,115 @@
+import streamlit as st
+
+from predictor import (
+    CLASS_LABELS,
+    STUDY_ENVIRONMENTS,
+    TUTORING_OPTIONS,
+    load_model,
+    model_version,
+    predict_performance
+)
+
+version = model_version()
+load_model(version)
+
+st.title("🤖 Student Performance Classification")
+st.markdown("### Enter Student Information")
+
+with st.form("predict_form"):
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        sleep_hours = st.slider(
+            "Sleep Hours per Day",
+            min_value=4.0,
+            max_value=12.0,
+            value=7.0,
+            step=0.1
+        )
+
+        exercise_frequency = st.slider(
+            "Exercise Frequency (per week)",
+            min_value=0,
+            max_value=7,
+            value=3
+        )
+
+        stress_level = st.slider(
+            "Stress Level",
+            min_value=1.0,
+            max_value=10.0,
+            value=5.0,
+            step=0.1
+        )
+
+        screen_time = st.slider(
+            "Daily Screen Time (hours)",
+            min_value=0.3,
+            max_value=21.0,
+            value=5.0,
+            step=0.1
+        )
+
+        motivation_level = st.slider(
+            "Motivation Level",
+            min_value=1,
+            max_value=10,
+            value=6
+        )
+
+    with col2:
+        exam_anxiety_score = st.slider(
+            "Exam Anxiety Score",
+            min_value=5.0,
+            max_value=10.0,
+            value=7.0,
+            step=0.5
+        )
+
+        study_efficiency = st.number_input(
+            "Study Efficiency",
+            min_value=0.0,
+            max_value=5.75,
+            value=2.0,
+            step=0.05
+        )
+
+        screen_time_penalty = st.number_input(
+            "Screen Time Penalty",
+            min_value=0.0,
+            max_value=90.0,
+            value=10.0,
+            step=1.0
+        )
+
+        study_environment = st.selectbox(
+            "Study Environment",
+            STUDY_ENVIRONMENTS
+        )
+
+        access_to_tutoring = st.selectbox(
+            "Access to Tutoring",
+            TUTORING_OPTIONS
+        )
+
+    submitted = st.form_submit_button("🎯 Predict Performance")
+
+if submitted:
+
+    prediction = predict_performance(
+        version,
+        sleep_hours=sleep_hours,
+        exercise_frequency=exercise_frequency,
+        stress_level=stress_level,
+        screen_time=screen_time,
+        study_environment=study_environment,
+        access_to_tutoring=access_to_tutoring,
+        motivation_level=motivation_level,
+        exam_anxiety_score=exam_anxiety_score,
+        study_efficiency=study_efficiency,
+        screen_time_penalty=screen_time_penalty
+    )
+    prediction_label = CLASS_LABELS[prediction] if 0 <= prediction < len(CLASS_LABELS) else "Unknown"
+
+    st.success(f"📊 Predicted Performance Level: **{prediction_label}**")
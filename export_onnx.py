@@ -0,0 +1,73 @@
+"""Export the XGBoost step of the trained pipeline to ONNX.
+
+The Streamlit app encodes inputs with the fitted scalers/encoder from the
+pickle and runs the classifier through onnxruntime, which avoids xgboost's
+per-call DMatrix setup on single-row predictions.
+
+Run once after retraining (needs `pip install onnxmltools`):
+
+    python export_onnx.py
+"""
+import joblib
+import numpy as np
+import pandas as pd
+import onnxruntime as ort
+from onnxmltools import convert_xgboost
+from onnxmltools.convert.common.data_types import FloatTensorType
+
+from predictor import compile_preprocessing, predict_one
+
+MODEL_PATH = "exam_score_calss_model.pkl"
+ONNX_PATH = "exam_score_calss_model.onnx"
+
+# ---------------------------------
+# Convert
+# ---------------------------------
+pipeline = joblib.load(MODEL_PATH)
+preprocessing = pipeline.named_steps["Preprocessing"]
+classifier = pipeline.named_steps["Model"]
+
+n_features = len(preprocessing.get_feature_names_out())
+onnx_model = convert_xgboost(
+    classifier,
+    initial_types=[("input", FloatTensorType([None, n_features]))],
+    target_opset=15
+)
+
+with open(ONNX_PATH, "wb") as f:
+    f.write(onnx_model.SerializeToString())
+
+# ---------------------------------
+# Check the app's prediction path against the pickled pipeline
+# ---------------------------------
+# goes through the same compile_preprocessing() + predict_one() the app uses,
+# so a retrain the hand-written encoder can't reproduce fails here
+rng = np.random.default_rng(42)
+n = 5000
+sample = pd.DataFrame({
+    'sleep_hours': rng.uniform(4.0, 12.0, n),
+    'exercise_frequency': rng.integers(0, 8, n),
+    'stress_level': rng.uniform(1.0, 10.0, n),
+    'screen_time': rng.uniform(0.3, 21.0, n),
+    'study_environment': rng.choice(
+        ['Quiet Room', 'Library', 'Co-Learning Group', 'Dorm', 'Cafe'], n
+    ),
+    'access_to_tutoring': rng.choice(["Yes", "No"], n),
+    'motivation_level': rng.integers(1, 11, n),
+    'exam_anxiety_score': rng.uniform(5.0, 10.0, n),
+    'study_efficiency': rng.uniform(0.0, 5.75, n),
+    'screen_time_penalty': rng.uniform(0.0, 90.0, n)
+})[list(pipeline.feature_names_in_)]
+
+encoder = compile_preprocessing(preprocessing)
+session = ort.InferenceSession(ONNX_PATH, providers=["CPUExecutionProvider"])
+app_labels = np.array([
+    predict_one(encoder, session, **row) for row in sample.to_dict("records")
+])
+sklearn_labels = pipeline.predict(sample)
+
+mismatches = int((app_labels != sklearn_labels).sum())
+if mismatches:
+    raise SystemExit(f"{mismatches} of {n} predictions differ from {MODEL_PATH}")
+
+print(f"Saved {ONNX_PATH} ({n} sample predictions match {MODEL_PATH})")
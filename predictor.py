@@ -0,0 +1,192 @@
+import os
+from pathlib import Path
+
+import streamlit as st
+import numpy as np
+
+# ---------------------------------
+# Load Model
+# ---------------------------------
+WARMUP_INPUT = {
+    'sleep_hours': 7.0,
+    'exercise_frequency': 3,
+    'stress_level': 5.0,
+    'screen_time': 5.0,
+    'study_environment': 'Quiet Room',
+    'access_to_tutoring': 'Yes',
+    'motivation_level': 6,
+    'exam_anxiety_score': 7.0,
+    'study_efficiency': 2.0,
+    'screen_time_penalty': 10.0
+}
+
+CLASS_LABELS = ("❌ At Risk", "⚠️ Average", "✅ High Performer")
+
+STUDY_ENVIRONMENTS = ('Quiet Room', 'Library', 'Co-Learning Group', 'Dorm', 'Cafe')
+
+TUTORING_OPTIONS = ("Yes", "No")
+
+# only sliders belong here: they already enforce their step, so snapping just
+# removes float noise. number_input fields accept typed off-grid values, and
+# snapping those would change what the model sees.
+INPUT_STEPS = {
+    'sleep_hours': 0.1,
+    'stress_level': 0.1,
+    'screen_time': 0.1,
+    'exam_anxiety_score': 0.5
+}
+
+FREE_INPUTS = ('study_efficiency', 'screen_time_penalty')
+
+MODEL_PATH = Path(__file__).parent / "exam_score_calss_model.pkl"
+ONNX_PATH = Path(__file__).parent / "exam_score_calss_model.onnx"
+
+
+def model_version():
+    # the files' mtimes key the model caches, so a redeployed model is picked
+    # up on the next rerun without restarting the server
+    return os.path.getmtime(MODEL_PATH), os.path.getmtime(ONNX_PATH)
+
+
+@st.cache_resource(max_entries=1)
+def load_model(version):
+    import joblib
+    import onnxruntime as ort
+
+    # only the fitted scalers and encoder are taken from the pickle; the
+    # XGBoost step runs from the ONNX export (see export_onnx.py)
+    pipeline = joblib.load(MODEL_PATH)
+    encoder = compile_preprocessing(pipeline.named_steps["Preprocessing"])
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    session = ort.InferenceSession(
+        str(ONNX_PATH),
+        options,
+        providers=["CPUExecutionProvider"]
+    )
+
+    # one throwaway prediction so the first click doesn't pay for the
+    # session's lazy setup (kernel selection, thread pools)
+    predict_one(encoder, session, **WARMUP_INPUT)
+    return encoder, session
+
+
+def compile_preprocessing(preprocessing):
+    # flatten the fitted ColumnTransformer into plain arrays so a single row
+    # can be encoded with numpy instead of pandas + per-transformer dispatch.
+    # Anything this can't reproduce exactly raises instead of silently
+    # mis-encoding; export_onnx.py checks the result against the pipeline.
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, RobustScaler, StandardScaler
+
+    numeric_columns, numeric_slots, centers, scales = [], [], [], []
+    onehot_slots = {}
+    slot = 0
+    for name, transformer, columns in preprocessing.transformers_:
+        if transformer == "drop":
+            continue
+        # once fitted, "passthrough" shows up as a FunctionTransformer
+        if not isinstance(transformer, Pipeline) or len(transformer.steps) != 1:
+            raise ValueError(f"transformer {name!r} must be a single-step Pipeline")
+        step = transformer.steps[0][1]
+
+        if isinstance(step, OneHotEncoder):
+            infrequent = step.min_frequency is not None or step.max_categories is not None
+            if step.handle_unknown != "error" or infrequent:
+                raise ValueError(f"{name!r}: only plain OneHotEncoder(handle_unknown='error') is supported")
+            # the dropped category maps to no slot (all zeros)
+            drop_idx = step.drop_idx_ if step.drop_idx_ is not None else [None] * len(columns)
+            for column, categories, dropped in zip(columns, step.categories_, drop_idx):
+                onehot_slots[column] = {}
+                for i, category in enumerate(categories):
+                    if i == dropped:
+                        onehot_slots[column][category] = None
+                    else:
+                        onehot_slots[column][category] = slot
+                        slot += 1
+            continue
+
+        if isinstance(step, RobustScaler):
+            if not (step.with_centering and step.with_scaling):
+                raise ValueError(f"{name!r}: RobustScaler needs with_centering and with_scaling")
+            center = step.center_
+        elif isinstance(step, StandardScaler):
+            if not (step.with_mean and step.with_std):
+                raise ValueError(f"{name!r}: StandardScaler needs with_mean and with_std")
+            center = step.mean_
+        else:
+            raise ValueError(f"{name!r}: unsupported step {type(step).__name__}")
+        numeric_columns.extend(columns)
+        numeric_slots.extend(range(slot, slot + len(columns)))
+        centers.extend(center)
+        scales.extend(step.scale_)
+        slot += len(columns)
+
+    return {
+        "numeric_columns": tuple(numeric_columns),
+        "numeric_slots": np.array(numeric_slots),
+        "centers": np.array(centers),
+        "scales": np.array(scales),
+        "onehot_slots": onehot_slots,
+        "n_features": slot
+    }
+
+
+def predict_one(encoder, session, **values):
+    features = np.zeros((1, encoder["n_features"]))
+    numeric = np.array([values[name] for name in encoder["numeric_columns"]], dtype=np.float64)
+    features[0, encoder["numeric_slots"]] = (numeric - encoder["centers"]) / encoder["scales"]
+    for name, slots in encoder["onehot_slots"].items():
+        slot = slots[values[name]]
+        if slot is not None:
+            features[0, slot] = 1.0
+    return session.run(None, {"input": features.astype(np.float32)})[0][0]
+
+
+def snap(value, step):
+    # put the value exactly on its widget's step grid so float drift
+    # (5.0000001 vs 5.0) doesn't split one slider position into two cache keys
+    return round(round(value / step) * step, 10)
+
+
+def predict_performance(version, **values):
+    for name, step in INPUT_STEPS.items():
+        values[name] = snap(values[name], step)
+    for name in FREE_INPUTS:
+        # canonical float for the cache key without moving the value
+        values[name] = round(values[name], 10)
+    return cached_predict(
+        version,
+        values['sleep_hours'], values['exercise_frequency'],
+        values['stress_level'], values['screen_time'],
+        STUDY_ENVIRONMENTS.index(values['study_environment']),
+        TUTORING_OPTIONS.index(values['access_to_tutoring']),
+        values['motivation_level'], values['exam_anxiety_score'],
+        values['study_efficiency'], values['screen_time_penalty']
+    )
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def cached_predict(
+    version,
+    sleep_hours, exercise_frequency, stress_level, screen_time,
+    study_environment, access_to_tutoring, motivation_level,
+    exam_anxiety_score, study_efficiency, screen_time_penalty
+):
+    # the categoricals arrive as small ints to keep the cache key compact
+    encoder, session = load_model(version)
+    return int(predict_one(
+        encoder,
+        session,
+        sleep_hours=sleep_hours,
+        exercise_frequency=exercise_frequency,
+        stress_level=stress_level,
+        screen_time=screen_time,
+        study_environment=STUDY_ENVIRONMENTS[study_environment],
+        access_to_tutoring=TUTORING_OPTIONS[access_to_tutoring],
+        motivation_level=motivation_level,
+        exam_anxiety_score=exam_anxiety_score,
+        study_efficiency=study_efficiency,
+        screen_time_penalty=screen_time_penalty
+    ))